@@ -17,7 +17,8 @@ from homeassistant.components.shelly.const import (
     REST_SENSORS_UPDATE_INTERVAL,
     RPC_SENSORS_POLLING_INTERVAL,
 )
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.shelly.coordinator import get_entry_data
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import (
@@ -104,6 +105,15 @@ async def mock_polling_rpc_update(
     await hass.async_block_till_done()
 
 
+async def trigger_coordinator_refresh(
+    hass: HomeAssistant, entry: ConfigEntry, kind: str
+) -> None:
+    """Refresh a block, rest, rpc or rpc_poll coordinator without moving time."""
+    coordinator = getattr(get_entry_data(hass)[entry.entry_id], kind)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+
 def register_entity(
     hass: HomeAssistant,
     domain: str,
@@ -145,6 +155,20 @@ def get_entity_state(hass: HomeAssistant, entity_id: str) -> str:
     return entity.state
 
 
+def assert_reauth_flow(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Assert a single Shelly reauth flow is in progress for the entry."""
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 1
+
+    flow = flows[0]
+    assert flow.get("step_id") == "reauth_confirm"
+    assert flow.get("handler") == DOMAIN
+
+    assert "context" in flow
+    assert flow["context"].get("source") == SOURCE_REAUTH
+    assert flow["context"].get("entry_id") == entry.entry_id
+
+
 def register_device(device_reg: DeviceRegistry, config_entry: ConfigEntry) -> None:
     """Register Shelly device."""
     device_reg.async_get_or_create(
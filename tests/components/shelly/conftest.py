@@ -390,6 +390,12 @@ async def mock_rpc_device():
         yield rpc_device_mock.return_value
 
 
+@pytest.fixture
+def mock_device(request: pytest.FixtureRequest) -> Mock:
+    """Return the block or rpc device mock named by the test parameter."""
+    return request.getfixturevalue(request.param)
+
+
 @pytest.fixture(autouse=True)
 def mock_bluetooth(enable_bluetooth):
     """Auto mock bluetooth."""
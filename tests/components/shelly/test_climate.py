@@ -24,7 +24,7 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.shelly.const import DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
@@ -33,7 +33,13 @@ from homeassistant.helpers.entity_registry import EntityRegistry
 from homeassistant.helpers.issue_registry import IssueRegistry
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
-from . import MOCK_MAC, init_integration, register_device, register_entity
+from . import (
+    MOCK_MAC,
+    assert_reauth_flow,
+    init_integration,
+    register_device,
+    register_entity,
+)
 from .conftest import MOCK_STATUS_COAP
 
 from tests.common import mock_restore_cache, mock_restore_cache_with_extra_data
@@ -491,16 +497,7 @@ async def test_block_set_mode_auth_error(
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 async def test_block_restored_climate_auth_error(
@@ -539,16 +536,7 @@ async def test_block_restored_climate_auth_error(
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 async def test_device_not_calibrated(
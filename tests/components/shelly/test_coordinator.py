@@ -1,7 +1,8 @@
 """Tests for Shelly coordinator."""
 
 from datetime import timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Any
+from unittest.mock import Mock, patch
 
 from aioshelly.const import MODEL_BULB, MODEL_BUTTON1
 from aioshelly.exceptions import (
@@ -9,7 +10,6 @@ from aioshelly.exceptions import (
     FirmwareUnsupported,
     InvalidAuthError,
 )
-from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
@@ -20,31 +20,29 @@ from homeassistant.components.shelly.const import (
     ATTR_DEVICE,
     ATTR_GENERATION,
     DOMAIN,
-    ENTRY_RELOAD_COOLDOWN,
     MAX_PUSH_UPDATE_FAILURES,
-    RPC_RECONNECT_INTERVAL,
-    SLEEP_PERIOD_MULTIPLIER,
-    UPDATE_PERIOD_MULTIPLIER,
 )
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.components.shelly.coordinator import get_entry_data
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
+    DeviceRegistry,
     async_entries_for_config_entry,
-    async_get as async_get_dev_reg,
     format_mac,
 )
 import homeassistant.helpers.issue_registry as ir
+from homeassistant.util import dt as dt_util
 
 from . import (
     MOCK_MAC,
+    assert_reauth_flow,
     get_entity_state,
     init_integration,
     inject_rpc_device_event,
-    mock_polling_rpc_update,
-    mock_rest_update,
     register_entity,
+    trigger_coordinator_refresh,
 )
 
 from tests.common import async_fire_time_changed
@@ -53,11 +51,47 @@ RELAY_BLOCK_ID = 0
 LIGHT_BLOCK_ID = 2
 SENSOR_BLOCK_ID = 3
 DEVICE_BLOCK_ID = 4
+RELOAD_COOLDOWN = 1
+
+CFG_CHANGED_EVENTS = {
+    "events": [
+        {"data": [], "event": "config_changed", "id": 1, "ts": 1668522399.2},
+        {"data": [], "id": 2, "ts": 1668522399.2},
+    ],
+    "ts": 1668522399.2,
+}
+SINGLE_PUSH_EVENTS = {
+    "events": [{"data": [], "event": "single_push", "id": 0, "ts": 1668522399.2}],
+    "ts": 1668522399.2,
+}
+
+
+async def _raise_invalid_auth(*args: Any, **kwargs: Any) -> None:
+    """Raise InvalidAuthError when awaited."""
+    raise InvalidAuthError
+
+
+async def _raise_device_connection_error(*args: Any, **kwargs: Any) -> None:
+    """Raise DeviceConnectionError when awaited."""
+    raise DeviceConnectionError
+
+
+async def _raise_firmware_unsupported(*args: Any, **kwargs: Any) -> None:
+    """Raise FirmwareUnsupported when awaited."""
+    raise FirmwareUnsupported
+
+
+@pytest.fixture(autouse=True)
+def fast_reload_cooldown(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shorten the config entry reload debouncer cooldown."""
+    monkeypatch.setattr(
+        "homeassistant.components.shelly.coordinator.ENTRY_RELOAD_COOLDOWN",
+        RELOAD_COOLDOWN,
+    )
 
 
 async def test_block_reload_on_cfg_change(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_block_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -74,8 +108,7 @@ async def test_block_reload_on_cfg_change(
     await hass.async_block_till_done()
 
     # Wait for debouncer
-    freezer.tick(timedelta(seconds=ENTRY_RELOAD_COOLDOWN))
-    async_fire_time_changed(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN))
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_name_channel_1") is not None
@@ -91,8 +124,7 @@ async def test_block_reload_on_cfg_change(
     assert hass.states.get("switch.test_name_channel_1") is not None
 
     # Wait for debouncer
-    freezer.tick(timedelta(seconds=ENTRY_RELOAD_COOLDOWN))
-    async_fire_time_changed(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN))
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_name_channel_1") is None
@@ -100,7 +132,6 @@ async def test_block_reload_on_cfg_change(
 
 async def test_block_no_reload_on_bulb_changes(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_block_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -123,8 +154,7 @@ async def test_block_no_reload_on_bulb_changes(
     assert hass.states.get("switch.test_name_channel_1") is not None
 
     # Wait for debouncer
-    freezer.tick(timedelta(seconds=ENTRY_RELOAD_COOLDOWN))
-    async_fire_time_changed(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN))
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_name_channel_1") is not None
@@ -138,163 +168,97 @@ async def test_block_no_reload_on_bulb_changes(
     assert hass.states.get("switch.test_name_channel_1") is not None
 
     # Wait for debouncer
-    freezer.tick(timedelta(seconds=ENTRY_RELOAD_COOLDOWN))
-    async_fire_time_changed(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN))
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_name_channel_1") is not None
 
 
-async def test_block_polling_auth_error(
+@pytest.mark.parametrize(
+    ("mock_device", "gen", "attr", "kind"),
+    [
+        ("mock_block_device", 1, "update", "block"),
+        ("mock_block_device", 1, "update_status", "rest"),
+        ("mock_rpc_device", 2, "update_status", "rpc_poll"),
+    ],
+    ids=["block-polling", "block-rest", "rpc-polling"],
+    indirect=["mock_device"],
+)
+async def test_update_auth_error(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
-    mock_block_device: Mock,
+    mock_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
+    gen: int,
+    attr: str,
+    kind: str,
 ) -> None:
-    """Test block device polling authentication error."""
-    monkeypatch.setattr(
-        mock_block_device,
-        "update",
-        AsyncMock(side_effect=InvalidAuthError),
-    )
-    entry = await init_integration(hass, 1)
+    """Test polling and REST update authentication error."""
+    entry = await init_integration(hass, gen)
 
-    assert entry.state is ConfigEntryState.LOADED
-
-    # Move time to generate polling
-    freezer.tick(timedelta(seconds=UPDATE_PERIOD_MULTIPLIER * 15))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    monkeypatch.setattr(mock_device, attr, _raise_invalid_auth)
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
+    await trigger_coordinator_refresh(hass, entry, kind)
 
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
+    assert entry.state is ConfigEntryState.LOADED
 
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
-async def test_block_rest_update_auth_error(
+@pytest.mark.parametrize(
+    ("attr", "kind", "entity_id"),
+    [
+        ("update", "block", "switch.test_name_channel_1"),
+        ("update_shelly", "rest", f"{BINARY_SENSOR_DOMAIN}.test_name_cloud"),
+    ],
+    ids=["polling-conn", "rest-conn"],
+)
+async def test_block_update_connection_error(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_block_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
+    attr: str,
+    kind: str,
+    entity_id: str,
 ) -> None:
-    """Test block REST update authentication error."""
+    """Test block device polling and REST update connection error."""
     register_entity(hass, BINARY_SENSOR_DOMAIN, "test_name_cloud", "cloud")
-    monkeypatch.setitem(mock_block_device.status, "cloud", {"connected": False})
+    monkeypatch.setitem(mock_block_device.status, "cloud", {"connected": True})
     monkeypatch.setitem(mock_block_device.status, "uptime", 1)
     entry = await init_integration(hass, 1)
 
-    monkeypatch.setattr(
-        mock_block_device,
-        "update_shelly",
-        AsyncMock(side_effect=InvalidAuthError),
-    )
-
-    assert entry.state is ConfigEntryState.LOADED
-
-    await mock_rest_update(hass, freezer)
-
-    assert entry.state is ConfigEntryState.LOADED
-
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
+    await trigger_coordinator_refresh(hass, entry, "rest")
+    assert get_entity_state(hass, entity_id) == STATE_ON
 
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
+    monkeypatch.setattr(mock_block_device, attr, _raise_device_connection_error)
+    await trigger_coordinator_refresh(hass, entry, kind)
 
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert get_entity_state(hass, entity_id) == STATE_UNAVAILABLE
 
 
 async def test_block_firmware_unsupported(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_block_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test block device polling authentication error."""
-    monkeypatch.setattr(
-        mock_block_device,
-        "update",
-        AsyncMock(side_effect=FirmwareUnsupported),
-    )
+    monkeypatch.setattr(mock_block_device, "update", _raise_firmware_unsupported)
     entry = await init_integration(hass, 1)
 
     assert entry.state is ConfigEntryState.LOADED
 
-    # Move time to generate polling
-    freezer.tick(timedelta(seconds=UPDATE_PERIOD_MULTIPLIER * 15))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    await trigger_coordinator_refresh(hass, entry, "block")
 
     assert entry.state is ConfigEntryState.LOADED
 
 
-async def test_block_polling_connection_error(
-    hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
-    mock_block_device: Mock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test block device polling connection error."""
-    monkeypatch.setattr(
-        mock_block_device,
-        "update",
-        AsyncMock(side_effect=DeviceConnectionError),
-    )
-    await init_integration(hass, 1)
-
-    assert get_entity_state(hass, "switch.test_name_channel_1") == STATE_ON
-
-    # Move time to generate polling
-    freezer.tick(timedelta(seconds=UPDATE_PERIOD_MULTIPLIER * 15))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
-
-    assert get_entity_state(hass, "switch.test_name_channel_1") == STATE_UNAVAILABLE
-
-
-async def test_block_rest_update_connection_error(
-    hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
-    mock_block_device: Mock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test block REST update connection error."""
-    entity_id = register_entity(hass, BINARY_SENSOR_DOMAIN, "test_name_cloud", "cloud")
-    monkeypatch.setitem(mock_block_device.status, "cloud", {"connected": True})
-    monkeypatch.setitem(mock_block_device.status, "uptime", 1)
-    await init_integration(hass, 1)
-
-    await mock_rest_update(hass, freezer)
-    assert get_entity_state(hass, entity_id) == STATE_ON
-
-    monkeypatch.setattr(
-        mock_block_device,
-        "update_shelly",
-        AsyncMock(side_effect=DeviceConnectionError),
-    )
-    await mock_rest_update(hass, freezer)
-
-    assert get_entity_state(hass, entity_id) == STATE_UNAVAILABLE
-
-
 async def test_block_sleeping_device_no_periodic_updates(
-    hass: HomeAssistant, freezer: FrozenDateTimeFactory, mock_block_device: Mock
+    hass: HomeAssistant, mock_block_device: Mock
 ) -> None:
     """Test block sleeping device no periodic updates."""
     entity_id = f"{SENSOR_DOMAIN}.test_name_temperature"
-    await init_integration(hass, 1, sleep_period=1000)
+    entry = await init_integration(hass, 1, sleep_period=1000)
 
     # Make device online
     mock_block_device.mock_update()
@@ -302,10 +266,8 @@ async def test_block_sleeping_device_no_periodic_updates(
 
     assert get_entity_state(hass, entity_id) == "22.1"
 
-    # Move time to generate polling
-    freezer.tick(timedelta(seconds=UPDATE_PERIOD_MULTIPLIER * 1000))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    # Sleeping device did not update within its sleep period
+    await trigger_coordinator_refresh(hass, entry, "block")
 
     assert get_entity_state(hass, entity_id) == STATE_UNAVAILABLE
 
@@ -314,14 +276,17 @@ async def test_block_device_push_updates_failure(
     hass: HomeAssistant,
     mock_block_device: Mock,
     issue_registry: ir.IssueRegistry,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test block device with push updates failure."""
-    await init_integration(hass, 1)
+    entry = await init_integration(hass, 1)
+    coordinator = get_entry_data(hass)[entry.entry_id].block
+    monkeypatch.setattr(
+        coordinator, "_push_update_failures", MAX_PUSH_UPDATE_FAILURES - 1
+    )
 
     # Updates with COAP_REPLAY type should create an issue
-    for _ in range(MAX_PUSH_UPDATE_FAILURES):
-        mock_block_device.mock_update_reply()
-        await hass.async_block_till_done()
+    mock_block_device.mock_update_reply()
 
     assert issue_registry.async_get_issue(
         domain=DOMAIN, issue_id=f"push_update_{MOCK_MAC}"
@@ -329,7 +294,6 @@ async def test_block_device_push_updates_failure(
 
     # An update with COAP_PERIODIC type should clear the issue
     mock_block_device.mock_update()
-    await hass.async_block_till_done()
 
     assert not issue_registry.async_get_issue(
         domain=DOMAIN, issue_id=f"push_update_{MOCK_MAC}"
@@ -341,6 +305,7 @@ async def test_block_button_click_event(
     mock_block_device: Mock,
     events: list[Event],
     monkeypatch: pytest.MonkeyPatch,
+    device_registry: DeviceRegistry,
 ) -> None:
     """Test block click event for Shelly button."""
     monkeypatch.setattr(mock_block_device.blocks[RELAY_BLOCK_ID], "sensor_ids", {})
@@ -355,8 +320,7 @@ async def test_block_button_click_event(
     mock_block_device.mock_update()
     await hass.async_block_till_done()
 
-    dev_reg = async_get_dev_reg(hass)
-    device = async_entries_for_config_entry(dev_reg, entry.entry_id)[0]
+    device = async_entries_for_config_entry(device_registry, entry.entry_id)[0]
 
     # Generate button click event
     mock_block_device.mock_update()
@@ -374,8 +338,6 @@ async def test_block_button_click_event(
     # Test ignore empty event
     monkeypatch.setattr(mock_block_device.blocks[DEVICE_BLOCK_ID], "inputEvent", "")
     mock_block_device.mock_update()
-    await hass.async_block_till_done()
-
     mock_block_device.mock_update()
     await hass.async_block_till_done()
 
@@ -384,7 +346,6 @@ async def test_block_button_click_event(
 
 async def test_rpc_reload_on_cfg_change(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -395,33 +356,13 @@ async def test_rpc_reload_on_cfg_change(
     monkeypatch.setitem(
         mock_rpc_device.config["sys"]["ui_data"], "consumption_types", ["lights"]
     )
-    inject_rpc_device_event(
-        monkeypatch,
-        mock_rpc_device,
-        {
-            "events": [
-                {
-                    "data": [],
-                    "event": "config_changed",
-                    "id": 1,
-                    "ts": 1668522399.2,
-                },
-                {
-                    "data": [],
-                    "id": 2,
-                    "ts": 1668522399.2,
-                },
-            ],
-            "ts": 1668522399.2,
-        },
-    )
+    inject_rpc_device_event(monkeypatch, mock_rpc_device, CFG_CHANGED_EVENTS)
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_switch_0") is not None
 
     # Wait for debouncer
-    freezer.tick(timedelta(seconds=ENTRY_RELOAD_COOLDOWN))
-    async_fire_time_changed(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN))
     await hass.async_block_till_done()
 
     assert hass.states.get("switch.test_switch_0") is None
@@ -429,7 +370,6 @@ async def test_rpc_reload_on_cfg_change(
 
 async def test_rpc_reload_with_invalid_auth(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -440,46 +380,19 @@ async def test_rpc_reload_with_invalid_auth(
     ):
         entry = await init_integration(hass, 2)
 
-        inject_rpc_device_event(
-            monkeypatch,
-            mock_rpc_device,
-            {
-                "events": [
-                    {
-                        "data": [],
-                        "event": "config_changed",
-                        "id": 1,
-                        "ts": 1668522399.2,
-                    },
-                    {
-                        "data": [],
-                        "id": 2,
-                        "ts": 1668522399.2,
-                    },
-                ],
-                "ts": 1668522399.2,
-            },
-        )
+        inject_rpc_device_event(monkeypatch, mock_rpc_device, CFG_CHANGED_EVENTS)
 
         await hass.async_block_till_done()
 
-        # Move time to generate reconnect
-        freezer.tick(timedelta(seconds=RPC_RECONNECT_INTERVAL))
-        async_fire_time_changed(hass)
+        # Wait for debouncer
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=RELOAD_COOLDOWN)
+        )
         await hass.async_block_till_done()
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 async def test_rpc_click_event(
@@ -487,29 +400,15 @@ async def test_rpc_click_event(
     mock_rpc_device: Mock,
     events: list[Event],
     monkeypatch: pytest.MonkeyPatch,
+    device_registry: DeviceRegistry,
 ) -> None:
     """Test RPC click event."""
     entry = await init_integration(hass, 2)
 
-    dev_reg = async_get_dev_reg(hass)
-    device = async_entries_for_config_entry(dev_reg, entry.entry_id)[0]
+    device = async_entries_for_config_entry(device_registry, entry.entry_id)[0]
 
     # Generate config change from switch to light
-    inject_rpc_device_event(
-        monkeypatch,
-        mock_rpc_device,
-        {
-            "events": [
-                {
-                    "data": [],
-                    "event": "single_push",
-                    "id": 0,
-                    "ts": 1668522399.2,
-                }
-            ],
-            "ts": 1668522399.2,
-        },
-    )
+    inject_rpc_device_event(monkeypatch, mock_rpc_device, SINGLE_PUSH_EVENTS)
     await hass.async_block_till_done()
 
     assert len(events) == 1
@@ -524,19 +423,11 @@ async def test_rpc_click_event(
 
 async def test_rpc_update_entry_sleep_period(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test RPC update entry sleep period."""
     entry = await init_integration(hass, 2, sleep_period=600)
-    register_entity(
-        hass,
-        SENSOR_DOMAIN,
-        "test_name_temperature",
-        "temperature:0-temperature_0",
-        entry,
-    )
 
     # Make device online
     mock_rpc_device.mock_update()
@@ -544,17 +435,15 @@ async def test_rpc_update_entry_sleep_period(
 
     assert entry.data["sleep_period"] == 600
 
-    # Move time to generate sleep period update
+    # Generate sleep period update
     monkeypatch.setitem(mock_rpc_device.status["sys"], "wakeup_period", 3600)
-    freezer.tick(timedelta(seconds=600 * SLEEP_PERIOD_MULTIPLIER))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    await trigger_coordinator_refresh(hass, entry, "rpc")
 
     assert entry.data["sleep_period"] == 3600
 
 
 async def test_rpc_sleeping_device_no_periodic_updates(
-    hass: HomeAssistant, freezer: FrozenDateTimeFactory, mock_rpc_device: Mock
+    hass: HomeAssistant, mock_rpc_device: Mock
 ) -> None:
     """Test RPC sleeping device no periodic updates."""
     entity_id = f"{SENSOR_DOMAIN}.test_name_temperature"
@@ -573,38 +462,26 @@ async def test_rpc_sleeping_device_no_periodic_updates(
 
     assert get_entity_state(hass, entity_id) == "22.9"
 
-    # Move time to generate polling
-    freezer.tick(timedelta(seconds=SLEEP_PERIOD_MULTIPLIER * 1000))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    # Sleeping device did not update within its sleep period
+    await trigger_coordinator_refresh(hass, entry, "rpc")
 
     assert get_entity_state(hass, entity_id) is STATE_UNAVAILABLE
 
 
 async def test_rpc_firmware_unsupported(
-    hass: HomeAssistant, freezer: FrozenDateTimeFactory, mock_rpc_device: Mock
+    hass: HomeAssistant, mock_rpc_device: Mock
 ) -> None:
     """Test RPC update entry unsupported firmware."""
     entry = await init_integration(hass, 2)
-    register_entity(
-        hass,
-        SENSOR_DOMAIN,
-        "test_name_temperature",
-        "temperature:0-temperature_0",
-        entry,
-    )
 
-    # Move time to generate sleep period update
-    freezer.tick(timedelta(seconds=600 * SLEEP_PERIOD_MULTIPLIER))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    # Generate sleep period update
+    await trigger_coordinator_refresh(hass, entry, "rpc")
 
     assert entry.state is ConfigEntryState.LOADED
 
 
 async def test_rpc_reconnect_auth_error(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -612,156 +489,81 @@ async def test_rpc_reconnect_auth_error(
     entry = await init_integration(hass, 2)
 
     monkeypatch.setattr(mock_rpc_device, "connected", False)
-    monkeypatch.setattr(
-        mock_rpc_device,
-        "initialize",
-        AsyncMock(
-            side_effect=InvalidAuthError,
-        ),
-    )
+    monkeypatch.setattr(mock_rpc_device, "initialize", _raise_invalid_auth)
 
     assert entry.state is ConfigEntryState.LOADED
 
-    # Move time to generate reconnect
-    freezer.tick(timedelta(seconds=RPC_RECONNECT_INTERVAL))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    await trigger_coordinator_refresh(hass, entry, "rpc")
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
+    assert_reauth_flow(hass, entry)
 
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
 
-
-async def test_rpc_polling_auth_error(
+@pytest.mark.parametrize(
+    ("attr", "connected", "kind", "entity_id", "initial_state"),
+    [
+        ("initialize", False, "rpc", "switch.test_switch_0", STATE_ON),
+        ("update_status", True, "rpc_poll", f"{SENSOR_DOMAIN}.test_name_rssi", "-63"),
+    ],
+    ids=["reconnect-conn", "polling-conn"],
+)
+async def test_rpc_update_connection_error(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
+    attr: str,
+    connected: bool,
+    kind: str,
+    entity_id: str,
+    initial_state: str,
 ) -> None:
-    """Test RPC polling authentication error."""
+    """Test RPC reconnect and polling connection error."""
     register_entity(hass, SENSOR_DOMAIN, "test_name_rssi", "wifi-rssi")
     entry = await init_integration(hass, 2)
 
-    monkeypatch.setattr(
-        mock_rpc_device,
-        "update_status",
-        AsyncMock(
-            side_effect=InvalidAuthError,
-        ),
-    )
-
-    assert entry.state is ConfigEntryState.LOADED
-
-    await mock_polling_rpc_update(hass, freezer)
-
-    assert entry.state is ConfigEntryState.LOADED
-
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
-
-
-async def test_rpc_reconnect_error(
-    hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
-    mock_rpc_device: Mock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test RPC reconnect error."""
-    await init_integration(hass, 2)
+    assert get_entity_state(hass, entity_id) == initial_state
 
-    assert get_entity_state(hass, "switch.test_switch_0") == STATE_ON
-
-    monkeypatch.setattr(mock_rpc_device, "connected", False)
-    monkeypatch.setattr(
-        mock_rpc_device,
-        "initialize",
-        AsyncMock(
-            side_effect=DeviceConnectionError,
-        ),
-    )
-
-    # Move time to generate reconnect
-    freezer.tick(timedelta(seconds=RPC_RECONNECT_INTERVAL))
-    async_fire_time_changed(hass)
-    await hass.async_block_till_done()
-
-    assert get_entity_state(hass, "switch.test_switch_0") == STATE_UNAVAILABLE
-
-
-async def test_rpc_polling_connection_error(
-    hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
-    mock_rpc_device: Mock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test RPC polling connection error."""
-    entity_id = register_entity(hass, SENSOR_DOMAIN, "test_name_rssi", "wifi-rssi")
-    await init_integration(hass, 2)
-
-    monkeypatch.setattr(
-        mock_rpc_device,
-        "update_status",
-        AsyncMock(
-            side_effect=DeviceConnectionError,
-        ),
-    )
-
-    assert get_entity_state(hass, entity_id) == "-63"
-
-    await mock_polling_rpc_update(hass, freezer)
+    monkeypatch.setattr(mock_rpc_device, "connected", connected)
+    monkeypatch.setattr(mock_rpc_device, attr, _raise_device_connection_error)
+    await trigger_coordinator_refresh(hass, entry, kind)
 
     assert get_entity_state(hass, entity_id) == STATE_UNAVAILABLE
 
 
 async def test_rpc_polling_disconnected(
     hass: HomeAssistant,
-    freezer: FrozenDateTimeFactory,
     mock_rpc_device: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test RPC polling device disconnected."""
     entity_id = register_entity(hass, SENSOR_DOMAIN, "test_name_rssi", "wifi-rssi")
-    await init_integration(hass, 2)
+    entry = await init_integration(hass, 2)
 
     monkeypatch.setattr(mock_rpc_device, "connected", False)
 
     assert get_entity_state(hass, entity_id) == "-63"
 
-    await mock_polling_rpc_update(hass, freezer)
+    await trigger_coordinator_refresh(hass, entry, "rpc_poll")
 
     assert get_entity_state(hass, entity_id) == STATE_UNAVAILABLE
 
 
 async def test_rpc_update_entry_fw_ver(
-    hass: HomeAssistant, mock_rpc_device: Mock, monkeypatch: pytest.MonkeyPatch
+    hass: HomeAssistant,
+    mock_rpc_device: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+    device_registry: DeviceRegistry,
 ) -> None:
     """Test RPC update entry firmware version."""
     entry = await init_integration(hass, 2, sleep_period=600)
-    dev_reg = async_get_dev_reg(hass)
 
     # Make device online
     mock_rpc_device.mock_update()
     await hass.async_block_till_done()
 
     assert entry.unique_id
-    device = dev_reg.async_get_device(
+    device = device_registry.async_get_device(
         identifiers={(DOMAIN, entry.entry_id)},
         connections={(CONNECTION_NETWORK_MAC, format_mac(entry.unique_id))},
     )
@@ -770,10 +572,10 @@ async def test_rpc_update_entry_fw_ver(
 
     monkeypatch.setattr(mock_rpc_device, "firmware_version", "99.0.0")
 
+    # Status updates of an online sleeping device are handled synchronously
     mock_rpc_device.mock_update()
-    await hass.async_block_till_done()
 
-    device = dev_reg.async_get_device(
+    device = device_registry.async_get_device(
         identifiers={(DOMAIN, entry.entry_id)},
         connections={(CONNECTION_NETWORK_MAC, format_mac(entry.unique_id))},
     )
@@ -24,7 +24,7 @@ from homeassistant.components.shelly.const import (
     MODELS_WITH_WRONG_SLEEP_PERIOD,
     BLEScannerMode,
 )
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PORT, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import (
@@ -34,7 +34,7 @@ from homeassistant.helpers.device_registry import (
 )
 from homeassistant.setup import async_setup_component
 
-from . import MOCK_MAC, init_integration, mutate_rpc_device_status
+from . import MOCK_MAC, assert_reauth_flow, init_integration, mutate_rpc_device_status
 
 from tests.common import MockConfigEntry
 
@@ -205,16 +205,7 @@ async def test_device_auth_error(
     entry = await init_integration(hass, gen)
     assert entry.state is ConfigEntryState.SETUP_ERROR
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 @pytest.mark.parametrize(("entry_sleep", "device_sleep"), [(None, 0), (1000, 1000)])
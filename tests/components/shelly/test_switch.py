@@ -13,7 +13,7 @@ from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
 from homeassistant.components.script import scripts_with_entity
 from homeassistant.components.shelly.const import DOMAIN, MODEL_WALL_DISPLAY
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     SERVICE_TURN_OFF,
@@ -27,7 +27,7 @@ from homeassistant.helpers.entity_registry import EntityRegistry
 import homeassistant.helpers.issue_registry as ir
 from homeassistant.setup import async_setup_component
 
-from . import init_integration, register_entity
+from . import assert_reauth_flow, init_integration, register_entity
 
 RELAY_BLOCK_ID = 0
 GAS_VALVE_BLOCK_ID = 6
@@ -110,16 +110,7 @@ async def test_block_set_state_auth_error(
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 async def test_block_device_update(
@@ -254,16 +245,7 @@ async def test_rpc_auth_error(
 
     assert entry.state is ConfigEntryState.LOADED
 
-    flows = hass.config_entries.flow.async_progress()
-    assert len(flows) == 1
-
-    flow = flows[0]
-    assert flow.get("step_id") == "reauth_confirm"
-    assert flow.get("handler") == DOMAIN
-
-    assert "context" in flow
-    assert flow["context"].get("source") == SOURCE_REAUTH
-    assert flow["context"].get("entry_id") == entry.entry_id
+    assert_reauth_flow(hass, entry)
 
 
 async def test_block_device_gas_valve(